@@ -3,47 +3,105 @@ Configuration management for Semantic Scholar MCP Server.
 All settings are loaded from environment variables or .env file.
 """
 
-import os
-from pydantic_settings import BaseSettings
-from pydantic import ConfigDict
-from dotenv import load_dotenv
+import functools
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Annotated, Any, Literal, Mapping
+from pydantic import Field, PrivateAttr, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables from .env file
-load_dotenv()
+# Canonical transport names. Interned so the validator always hands back the
+# same objects and mode checks can compare by identity.
+TRANSPORT_STDIO = sys.intern("stdio")
+TRANSPORT_STREAMABLE_HTTP = sys.intern("streamable-http")
+_TRANSPORT_HTTP_ALIAS = sys.intern("http")
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
     # Semantic Scholar API settings
-    semantic_scholar_api_key: str = os.getenv("SEMANTIC_SCHOLAR_API_KEY", "")
-    semantic_scholar_base_url: str = os.getenv(
-        "SEMANTIC_SCHOLAR_BASE_URL", "https://api.semanticscholar.org"
-    )
+    semantic_scholar_api_key: str = ""
+    semantic_scholar_base_url: str = "https://api.semanticscholar.org"
 
     # MCP Server settings
-    mcp_server_name: str = os.getenv("MCP_SERVER_NAME", "SemanticSearch")
-    mcp_server_host: str = os.getenv("MCP_SERVER_HOST", "localhost")
-    mcp_server_port: int = int(os.getenv("MCP_SERVER_PORT", "5002"))
-    mcp_log_level: str = os.getenv("MCP_LOG_LEVEL", "INFO")
+    mcp_server_name: str = "SemanticSearch"
+    mcp_server_host: str = "localhost"
+    mcp_server_port: Annotated[int, Field(ge=1, le=65535)] = 5002
+    mcp_log_level: str = "INFO"
 
     # Rate limiting and HTTP settings
-    request_timeout: int = int(os.getenv("REQUEST_TIMEOUT", "30"))
-    max_retries: int = int(os.getenv("MAX_RETRIES", "3"))
-    retry_delay: float = float(os.getenv("RETRY_DELAY", "1.0"))
+    request_timeout: Annotated[int, Field(ge=1)] = 30
+    max_retries: Annotated[int, Field(ge=0, le=100)] = 3
+    retry_delay: Annotated[float, Field(ge=0.0)] = 1.0
+    max_concurrent_requests: Annotated[int, Field(ge=1)] = 4
+
+    # Response cache settings (a TTL or max size of 0 disables caching)
+    response_cache_ttl: Annotated[float, Field(ge=0.0)] = 300.0
+    response_cache_max_size: Annotated[int, Field(ge=0)] = 1024
 
     # Transport mode settings
-    mcp_transport: str = os.getenv("MCP_TRANSPORT", "streamable-http")  # "stdio" or "streamable-http"
+    mcp_transport: Literal["stdio", "streamable-http"] = TRANSPORT_STREAMABLE_HTTP
+
+    model_config = SettingsConfigDict(
+        # MCP clients often start the server from another working directory, so
+        # the .env next to this file is read too (and wins over one in the cwd)
+        env_file=(".env", Path(__file__).with_name(".env")),
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+        frozen=True,
+    )
+
+    # Derived values computed once at load time
+    _is_stdio: bool = PrivateAttr(default=False)
+    _is_http: bool = PrivateAttr(default=False)
+    _rate_limit_delay: float = PrivateAttr(default=3.0)
+
+    @field_validator("mcp_transport", mode="before")
+    @classmethod
+    def normalize_transport(cls, value: Any) -> Any:
+        """Canonicalize the transport name ("HTTP" and "http" mean streamable-http)."""
+        if isinstance(value, str):
+            value = value.strip().lower()
+            if value == TRANSPORT_STDIO:
+                return TRANSPORT_STDIO
+            if value == TRANSPORT_STREAMABLE_HTTP or value == _TRANSPORT_HTTP_ALIAS:
+                return TRANSPORT_STREAMABLE_HTTP
+        return value
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute values that are read on every request."""
+        self._is_stdio = self.mcp_transport is TRANSPORT_STDIO
+        self._is_http = not self._is_stdio
+        # With API key: 1 request per second
+        # Without API key: 100 requests per 5 minutes = 3 second intervals
+        self._rate_limit_delay = 1.0 if self.semantic_scholar_api_key else 3.0
 
-    model_config = ConfigDict(env_file=".env", case_sensitive=False)
 
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, constructing them on first access."""
+    return Settings()
 
-# Global settings instance
-settings = Settings()
 
+def __getattr__(name: str):
+    """Expose the global settings instance as config.settings for compatibility."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def get_semantic_scholar_headers() -> dict[str, str]:
-    """Get headers for Semantic Scholar API requests."""
+
+@functools.lru_cache(maxsize=1)
+def get_semantic_scholar_headers() -> Mapping[str, str]:
+    """
+    Get headers for Semantic Scholar API requests.
+
+    Settings do not change after startup, so the headers are built once and
+    shared as a read-only mapping. Use dict(...) if a mutable copy is needed.
+    """
+    settings = get_settings()
     headers = {
         "User-Agent": f"{settings.mcp_server_name}/1.0",
         "Accept": "application/json",
@@ -52,32 +110,24 @@ def get_semantic_scholar_headers() -> dict[str, str]:
     if settings.semantic_scholar_api_key:
         headers["x-api-key"] = settings.semantic_scholar_api_key
 
-    return headers
+    return MappingProxyType(headers)
 
 
 def get_rate_limit_delay() -> float:
     """Get appropriate delay between requests based on API key availability."""
-    if settings.semantic_scholar_api_key:
-        # With API key: 1 request per second
-        return 1.0
-    else:
-        # Without API key: 100 requests per 5 minutes = 3 second intervals
-        return 3.0
+    return get_settings()._rate_limit_delay
 
 
 def is_stdio_mode() -> bool:
     """Check if server should run in stdio mode."""
-    return settings.mcp_transport.lower() == "stdio"
+    return get_settings()._is_stdio
 
 
 def is_http_mode() -> bool:
     """Check if server should run in HTTP mode."""
-    return settings.mcp_transport.lower() in ["streamable-http", "http"]
+    return get_settings()._is_http
 
 
 def get_transport_mode() -> str:
     """Get the appropriate transport mode string."""
-    if is_stdio_mode():
-        return "stdio"
-    else:
-        return "streamable-http"
+    return get_settings().mcp_transport
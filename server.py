@@ -6,11 +6,19 @@ through MCP (Model Context Protocol) with streaming HTTP transport.
 """
 
 import asyncio
+import functools
+import importlib.util
 import json
 import logging
-from typing import Dict, Optional, Any
+import random
+import re
+import time
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Any, Tuple, Union
 import httpx
+import orjson
 from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.fastmcp.prompts import base
 from config import settings, get_semantic_scholar_headers, get_rate_limit_delay, is_http_mode, get_transport_mode
 
 # Configure logging
@@ -34,15 +42,96 @@ else:
 # HTTP client for API requests
 http_client: Optional[httpx.AsyncClient] = None
 
+# HTTP/2 lets concurrent tool calls share one connection, but needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool limits for the shared client
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 40
+
+# Client-side throttling shared by all tool calls: the semaphore bounds requests
+# in flight and each send reserves a slot at least the rate limit delay apart.
+# It never admits more requests than the pool keeps warm connections for, so
+# excess calls queue here instead of waiting on (or opening) sockets in httpx.
+_api_semaphore = asyncio.Semaphore(
+    min(settings.max_concurrent_requests, HTTP_MAX_KEEPALIVE_CONNECTIONS)
+)
+_next_send_ts = 0.0
+# Settings are frozen, so the delay can be read once instead of on every request
+_rate_limit_delay = get_rate_limit_delay()
+# Rate limit and retry waits go through this alias so tests can skip them
+# without replacing asyncio.sleep for the whole event loop
+_sleep = asyncio.sleep
+
+# Valid paper field names for Semantic Scholar API
+PAPER_FIELDS = (
+    "paperId",
+    "title",
+    "abstract",
+    "venue",
+    "year",
+    "referenceCount",
+    "citationCount",
+    "influentialCitationCount",
+    "isOpenAccess",
+    "fieldsOfStudy",
+    "s2FieldsOfStudy",
+    "publicationTypes",
+    "publicationDate",
+    "journal",
+    "authors",
+    "citations",
+    "references",
+    "url",
+    "publicationVenue",
+    "externalIds",
+    "openAccessPdf",
+)
+_VALID_PAPER_FIELDS = frozenset(PAPER_FIELDS)
+_VALID_PAPER_FIELDS_SORTED = sorted(_VALID_PAPER_FIELDS)
+
+# Response headers worth keeping in error logs; the rest only go to DEBUG
+_ERROR_LOG_HEADERS = ("x-ratelimit-remaining", "retry-after", "content-type")
+# Prefix of the error raised for 400 responses, which callers may recover from
+_BAD_REQUEST_ERROR = "Bad Request (400)"
+
+# Upper bound on IDs accepted by the /paper/batch endpoint
+MAX_BATCH_PAPER_IDS = 500
+
+# Concurrent get_paper_details calls asking for the same fields share one
+# /paper/batch request: fields -> paper_id -> futures waiting on that paper
+_pending_papers: Dict[Optional[str], Dict[str, List[asyncio.Future]]] = {}
+_paper_batch_tasks: "set[asyncio.Task]" = set()
+# How long the first lookup waits for others to join its batch
+PAPER_BATCH_WINDOW = 0.01
+
+# Year range written with a dash ("2024-2025"); the API expects "2024:2025"
+_YEAR_RANGE_RE = re.compile(r"(\d{4})-(\d{4})")
+
+# In-process response cache: key -> (stored_at, result, etag), least recently used first
+_response_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Union[Dict[str, Any], bytes], Optional[str]]]" = OrderedDict()
+# Requests currently being sent, keyed like the response cache
+_inflight_requests: "Dict[Tuple[str, str, str], asyncio.Future]" = {}
+# Keys turned away once while the cache was full; admitted on their next miss
+_cache_doorkeeper: "set[Tuple[str, str, str]]" = set()
+
 
 async def init_http_client():
     """Initialize the HTTP client with proper configuration."""
     global http_client
+    # No lock needed: nothing is awaited between the check and the assignment,
+    # so concurrent callers on the event loop can never build two clients
     if http_client is None:
         http_client = httpx.AsyncClient(
+            base_url=settings.semantic_scholar_base_url,
             timeout=httpx.Timeout(settings.request_timeout),
             headers=get_semantic_scholar_headers(),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=30.0,
+            ),
+            http2=HTTP2_AVAILABLE,
         )
     return http_client
 
@@ -55,80 +144,334 @@ async def close_http_client():
         http_client = None
 
 
-def filter_open_access_pdf_disclaimer(data: Any) -> Any:
+def _reserve_send_slot() -> float:
+    """Claim the next free send slot and return how long to wait until it."""
+    global _next_send_ts
+    now = time.monotonic()
+    send_at = max(now, _next_send_ts)
+    _next_send_ts = send_at + _rate_limit_delay
+    return send_at - now
+
+
+async def _wait_for_rate_limit():
+    """Wait until this request's send slot, keeping sends _rate_limit_delay seconds apart."""
+    # Slots are reserved synchronously, so concurrent callers each get their own
+    # slot without a lock and sleep in parallel instead of queueing behind one another
+    wait = _reserve_send_slot()
+    if wait > 0:
+        await _sleep(wait)
+
+
+def _cache_key(
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    method: str,
+    json_body: Optional[Dict[str, Any]] = None,
+    raw: bool = False,
+) -> Tuple[str, str, str]:
+    """Build a response cache key that is independent of parameter order."""
+    return (method, endpoint, json.dumps([params, json_body, raw], sort_keys=True, default=str))
+
+
+def _cache_get(key: Tuple[str, str, str]) -> Optional[Union[Dict[str, Any], bytes]]:
     """
-    Recursively remove 'disclaimer' field from openAccessPdf objects in API responses.
+    Return a fresh cached response.
+
+    Expired entries are dropped, unless they carry an ETag: those are kept so
+    the next request can revalidate them with If-None-Match.
+    """
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, result, etag = entry
+    if time.monotonic() - stored_at > settings.response_cache_ttl:
+        if etag is None:
+            del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return result
+
+
+def _cache_revalidation(
+    key: Tuple[str, str, str],
+) -> Optional[Tuple[Union[Dict[str, Any], bytes], str]]:
+    """Return the cached result and ETag a conditional request can revalidate."""
+    entry = _response_cache.get(key)
+    if entry is None or entry[2] is None:
+        return None
+    return entry[1], entry[2]
+
+
+def _cache_put(
+    key: Tuple[str, str, str],
+    result: Union[Dict[str, Any], bytes],
+    etag: Optional[str] = None,
+) -> None:
+    """
+    Store a response, evicting the least recently used entries beyond the size limit.
+
+    Once the cache is full a new key is only admitted the second time it is seen
+    (a TinyLFU-style doorkeeper), so a run of one-off queries cannot flush out
+    papers that agents keep coming back to. An expired LRU entry has nothing
+    left to protect, so it is always replaced.
+    """
+    max_size = settings.response_cache_max_size
+    if settings.response_cache_ttl <= 0 or max_size <= 0:
+        return
+    if key not in _response_cache and len(_response_cache) >= max_size:
+        victim_stored_at = next(iter(_response_cache.values()))[0]
+        victim_expired = time.monotonic() - victim_stored_at > settings.response_cache_ttl
+        if not victim_expired and key not in _cache_doorkeeper:
+            # Reset instead of growing forever, which also ages out stale sightings
+            if len(_cache_doorkeeper) >= max_size:
+                _cache_doorkeeper.clear()
+            _cache_doorkeeper.add(key)
+            return
+        _cache_doorkeeper.discard(key)
+    _response_cache[key] = (time.monotonic(), result, etag)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > max_size:
+        _response_cache.popitem(last=False)
+
+
+def clear_response_cache():
+    """Drop all cached API responses."""
+    _response_cache.clear()
+    _cache_doorkeeper.clear()
+
+
+def _strip_disclaimers_inplace(data: Any) -> None:
+    """
+    Remove the 'disclaimer' field from openAccessPdf objects in API responses.
     This removes unnecessary legal disclaimer information that's not useful for AI applications.
-    
+
+    The parsed JSON is walked iteratively and mutated in place, so only the
+    openAccessPdf objects are touched instead of rebuilding every dict and list.
+
     Args:
-        data: API response data (dict, list, or other)
-        
-    Returns:
-        Filtered data with disclaimer fields removed from openAccessPdf objects
-    """
-    if isinstance(data, dict):
-        filtered_data = {}
-        for key, value in data.items():
-            if key == "openAccessPdf" and isinstance(value, dict):
-                # Filter out disclaimer from openAccessPdf object
-                filtered_pdf = {k: v for k, v in value.items() if k != "disclaimer"}
-                filtered_data[key] = filtered_pdf
-            else:
-                # Recursively filter nested structures
-                filtered_data[key] = filter_open_access_pdf_disclaimer(value)
-        return filtered_data
-    elif isinstance(data, list):
-        # Filter each item in the list
-        return [filter_open_access_pdf_disclaimer(item) for item in data]
-    else:
-        # Return primitive values as-is
-        return data
+        data: Parsed API response data (dict, list, or other)
+    """
+    stack = deque([data])
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            pdf = node.get("openAccessPdf")
+            if isinstance(pdf, dict):
+                pdf.pop("disclaimer", None)
+            stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+
+
+def _append_metadata(body: bytes, metadata: Dict[str, Any]) -> bytes:
+    """
+    Add a top-level _metadata field to an encoded JSON object.
+
+    Only the metadata is encoded; it is spliced in before the closing brace so
+    the (potentially large) response body never has to be re-serialized.
+    """
+    body = body.rstrip()
+    if not body.endswith(b"}"):
+        raise ValueError("Expected a JSON object in the API response")
+    head = body[:-1].rstrip()
+    separator = b"" if head.endswith(b"{") else b","
+    return head + separator + b'"_metadata":' + orjson.dumps(metadata) + b"}"
+
+
+def _error_response(error: str, **details: Any) -> str:
+    """Serialize a tool error payload: {"error": ..., **details}."""
+    return orjson.dumps({"error": error, **details}).decode()
+
+
+def _with_error_envelope(action: str):
+    """
+    Turn exceptions raised by a tool into a JSON error response.
+
+    Args:
+        action: What the tool does, used in the message ("Error <action>: ...")
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                error_msg = f"Error {action}: {str(e)}"
+                logger.error(error_msg)
+                return _error_response(error_msg)
+
+        return wrapper
+
+    return decorator
+
+
+def _requests_open_access_pdf(params: Optional[Dict[str, Any]]) -> bool:
+    """
+    Check whether a request can return openAccessPdf objects.
+
+    The API only includes openAccessPdf when it is named in the 'fields'
+    parameter (directly or as a nested field such as citingPaper.openAccessPdf);
+    the default field sets never contain it.
+    """
+    if not params:
+        return False
+    fields = params.get("fields")
+    return isinstance(fields, str) and "openAccessPdf" in fields
+
+
+def _build_params(**params: Any) -> Dict[str, Any]:
+    """Build API query parameters, leaving out options that were not given (None or "")."""
+    return {k: v for k, v in params.items() if v is not None and v != ""}
+
+
+def _is_retryable(status_code: int) -> bool:
+    """Return True for responses worth retrying: rate limiting and server errors."""
+    return status_code == 429 or status_code >= 500
+
+
+def _retry_backoff(response: httpx.Response, attempt: int) -> Optional[float]:
+    """
+    Seconds to wait before retrying a failed response, or None to give up.
+
+    Uses jittered exponential backoff based on settings.retry_delay, but never
+    less than what the API asked for in Retry-After. A Retry-After longer than
+    settings.request_timeout is not waited out; the error is raised instead.
+    """
+    backoff = settings.retry_delay * 2 ** attempt + random.uniform(0, settings.retry_delay)
+    try:
+        retry_after = float(response.headers.get("Retry-After", 0))
+    except ValueError:  # HTTP-date form, fall back to our own schedule
+        return backoff
+    if not retry_after <= settings.request_timeout:  # also rejects inf and nan
+        logger.warning("⏳ HTTP %s asks to retry after %ss, not retrying", response.status_code, retry_after)
+        return None
+    return max(retry_after, backoff)
 
 
 async def make_api_request(
-    endpoint: str, params: Optional[Dict[str, Any]] = None, method: str = "GET"
-) -> Dict[str, Any]:
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    method: str = "GET",
+    json_body: Optional[Dict[str, Any]] = None,
+    raw: bool = False,
+) -> Union[Dict[str, Any], bytes]:
     """
     Make a request to the Semantic Scholar API with rate limiting and error handling.
 
+    Rate limited (429) and server error (5xx) responses are retried up to
+    settings.max_retries times with backoff before the error is raised. A
+    Retry-After longer than settings.request_timeout raises straight away.
+    Successful responses are cached for settings.response_cache_ttl seconds, so
+    repeated identical requests skip both the network and the rate limit delay;
+    identical requests made while one is still in flight share its result.
+    Cached results are shared between callers and must not be mutated.
+
     Args:
-        endpoint: API endpoint path
+        endpoint: API endpoint path, relative to the client's base URL
         params: Query parameters
         method: HTTP method
+        json_body: JSON request body (POST only)
+        raw: Return the response body as JSON bytes instead of parsed data,
+             for callers that pass it straight through
 
     Returns:
-        JSON response data
+        JSON response data, or the encoded body when raw is set
 
     Raises:
         httpx.HTTPError: If request fails with detailed error information
     """
+    cache_key = _cache_key(endpoint, params, method, json_body, raw)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        logger.info("♻️ Cache hit for %s %s", method, endpoint)
+        return cached
+
+    # Single-flight: identical concurrent requests share one in-flight send.
+    # Callers await it through shield() so one cancelled caller can't abort it
+    # for the others.
+    pending = _inflight_requests.get(cache_key)
+    if pending is None:
+        pending = asyncio.ensure_future(
+            _send_api_request(endpoint, params, method, json_body, raw, cache_key)
+        )
+        _inflight_requests[cache_key] = pending
+        pending.add_done_callback(lambda _: _inflight_requests.pop(cache_key, None))
+    return await asyncio.shield(pending)
+
+
+async def _send_api_request(
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    method: str,
+    json_body: Optional[Dict[str, Any]],
+    raw: bool,
+    cache_key: Tuple[str, str, str],
+) -> Union[Dict[str, Any], bytes]:
+    """Send an API request for make_api_request and cache a successful result."""
     client = await init_http_client()
-    url = f"{settings.semantic_scholar_base_url}{endpoint}"
-
-    # Add rate limiting delay
-    await asyncio.sleep(get_rate_limit_delay())
 
-    logger.info(f"🌐 Making {method} request to: {url}")
-    if params:
-        logger.info(f"📋 Request parameters: {params}")
+    logger.info("🌐 Making %s request to: %s", method, endpoint)
+    # params can carry long field lists; skip the call entirely when INFO is off
+    if params and logger.isEnabledFor(logging.INFO):
+        logger.info("📋 Request parameters: %r", params)
 
     try:
+        # Resolve the send once; retries reuse it
+        revalidation = None
         if method == "GET":
-            response = await client.get(url, params=params)
+            # An expired entry with an ETag can be revalidated instead of re-downloaded.
+            # Its body is captured now, as the entry may be evicted before the 304 arrives
+            revalidation = _cache_revalidation(cache_key)
+            headers = {"If-None-Match": revalidation[1]} if revalidation else None
+            send = functools.partial(client.get, endpoint, params=params, headers=headers)
         elif method == "POST":
-            response = await client.post(url, json=params)
+            send = functools.partial(client.post, endpoint, params=params, json=json_body)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
-        logger.info(f"📡 Response status: {response.status_code}")
+        for attempt in range(settings.max_retries + 1):
+            async with _api_semaphore:
+                await _wait_for_rate_limit()
+                response = await send()
+
+            logger.info("📡 Response status: %s", response.status_code)
+            if attempt == settings.max_retries or not _is_retryable(response.status_code):
+                break
+            delay = _retry_backoff(response, attempt)
+            if delay is None:
+                break
+            logger.warning(
+                "⏳ HTTP %s, retrying in %.1fs (attempt %d of %d)",
+                response.status_code, delay, attempt + 1, settings.max_retries,
+            )
+            await _sleep(delay)
+
+        if response.status_code == 304 and revalidation is not None:
+            logger.info("♻️ Cached response still valid for %s %s", method, endpoint)
+            result, etag = revalidation
+            # Restarts the TTL, or stores the entry again if it was evicted meanwhile
+            _cache_put(cache_key, result, etag)
+            return result
         response.raise_for_status()
         
-        result = response.json()
         logger.info("✅ API request successful")
-        
-        # Filter out disclaimer from openAccessPdf fields
-        filtered_result = filter_open_access_pdf_disclaimer(result)
-        return filtered_result
+
+        if raw:
+            result = response.content
+            # Only pay for a parse/re-encode when there is a disclaimer to strip
+            if _requests_open_access_pdf(params) and b'"openAccessPdf"' in result:
+                data = orjson.loads(result)
+                _strip_disclaimers_inplace(data)
+                result = orjson.dumps(data)
+        else:
+            result = orjson.loads(response.content)
+            # Filter out disclaimer from openAccessPdf fields
+            if _requests_open_access_pdf(params):
+                _strip_disclaimers_inplace(result)
+
+        _cache_put(cache_key, result, response.headers.get("ETag"))
+        return result
 
     except httpx.HTTPStatusError as e:
         error_details = {
@@ -136,24 +479,28 @@ async def make_api_request(
             "url": str(e.request.url),
             "method": e.request.method,
             "response_text": e.response.text,
-            "headers": dict(e.response.headers)
+            "headers": {
+                k: e.response.headers[k] for k in _ERROR_LOG_HEADERS if k in e.response.headers
+            },
         }
         
-        logger.error(f"❌ HTTP {e.response.status_code} error: {e.response.text}")
-        logger.error(f"🔍 Request details: {error_details}")
+        logger.error("❌ HTTP %s error: %s", e.response.status_code, e.response.text)
+        logger.error("🔍 Request details: %s", error_details)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 Full response headers: %r", dict(e.response.headers))
         
         if e.response.status_code == 400:
             # Try to parse error response for more details
             try:
                 error_json = e.response.json()
-                detailed_msg = f"Bad Request (400): {error_json.get('message', e.response.text)}"
+                detailed_msg = f"{_BAD_REQUEST_ERROR}: {error_json.get('message', e.response.text)}"
                 if 'error' in error_json:
                     detailed_msg += f" - {error_json['error']}"
                 if 'details' in error_json:
                     detailed_msg += f" - Details: {error_json['details']}"
                 raise httpx.HTTPError(detailed_msg)
             except json.JSONDecodeError:
-                raise httpx.HTTPError(f"Bad Request (400): Invalid API parameters. Response: {e.response.text}")
+                raise httpx.HTTPError(f"{_BAD_REQUEST_ERROR}: Invalid API parameters. Response: {e.response.text}")
         elif e.response.status_code == 401:
             raise httpx.HTTPError("Authentication failed (401): Invalid or missing API key")
         elif e.response.status_code == 403:
@@ -177,7 +524,7 @@ async def make_api_request(
             raise httpx.HTTPError("Connection error: Unable to reach Semantic Scholar API")
         else:
             raise httpx.HTTPError(f"Network error: {str(e)}")
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # also raised by orjson.loads
         logger.error(f"❌ JSON decode error: {e}")
         raise httpx.HTTPError(f"Invalid JSON response from API: {str(e)}")
     except Exception as e:
@@ -185,6 +532,120 @@ async def make_api_request(
         raise httpx.HTTPError(f"Unexpected error: {str(e)}")
 
 
+def _paper_cache_key(paper_id: str, params: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Cache key of a single-paper lookup, shared by /paper/{id} and batch results."""
+    return _cache_key(f"/graph/v1/paper/{paper_id}", params, "GET", raw=True)
+
+
+async def _fetch_paper(paper_id: str, fields: Optional[str]) -> bytes:
+    """
+    Fetch one paper as JSON bytes, coalescing with concurrent lookups.
+
+    Cached papers are returned straight away. Lookups that arrive within
+    PAPER_BATCH_WINDOW of each other cost a single round-trip and rate limit
+    slot; a lone lookup still uses the plain /paper/{id} endpoint.
+    """
+    cached = _cache_get(_paper_cache_key(paper_id, _build_params(fields=fields)))
+    if cached is not None:
+        logger.info("♻️ Cache hit for paper %s", paper_id)
+        return cached
+
+    future = asyncio.get_running_loop().create_future()
+    group = _pending_papers.get(fields)
+    if group is None:
+        group = _pending_papers[fields] = {}
+        task = asyncio.create_task(_flush_paper_batch(fields, group))
+        _paper_batch_tasks.add(task)
+        task.add_done_callback(_paper_batch_tasks.discard)
+        task.add_done_callback(functools.partial(_close_paper_batch, fields, group))
+    group.setdefault(paper_id, []).append(future)
+    if len(group) >= MAX_BATCH_PAPER_IDS:
+        # Full: later lookups start a new batch
+        del _pending_papers[fields]
+    return await future
+
+
+def _close_paper_batch(
+    fields: Optional[str], group: Dict[str, List[asyncio.Future]], task: asyncio.Task
+) -> None:
+    """
+    Fail the lookups a finished flush task left unresolved.
+
+    Runs as the task's done callback, so it also covers a flush that raised or
+    was cancelled, even before it started; no caller is left waiting forever.
+    """
+    if _pending_papers.get(fields) is group:
+        del _pending_papers[fields]
+    unresolved = httpx.HTTPError("Paper lookup failed: batch request did not complete")
+    for futures in group.values():
+        for future in futures:
+            if not future.done():
+                future.set_exception(unresolved)
+
+
+async def _fetch_papers_individually(
+    paper_ids: List[str], params: Dict[str, Any]
+) -> List[Union[bytes, BaseException]]:
+    """Fetch each paper with its own /paper/{id} request; failures are returned, not raised."""
+    return await asyncio.gather(
+        *(make_api_request(f"/graph/v1/paper/{paper_id}", params, raw=True) for paper_id in paper_ids),
+        return_exceptions=True,
+    )
+
+
+async def _flush_paper_batch(
+    fields: Optional[str], group: Dict[str, List[asyncio.Future]]
+) -> None:
+    """Fetch every paper collected in group and resolve the waiting futures."""
+    await asyncio.sleep(PAPER_BATCH_WINDOW)
+    if _pending_papers.get(fields) is group:
+        del _pending_papers[fields]
+
+    params = _build_params(fields=fields)
+    paper_ids = list(group)
+    if len(paper_ids) == 1:
+        results = await _fetch_papers_individually(paper_ids, params)
+    else:
+        try:
+            papers = await make_api_request(
+                "/graph/v1/paper/batch", params, method="POST", json_body={"ids": paper_ids}
+            )
+            # One entry per requested ID, in order; anything else can't be matched up
+            if not isinstance(papers, list) or len(papers) != len(paper_ids):
+                raise httpx.HTTPError(
+                    f"Unexpected batch response: expected {len(paper_ids)} papers"
+                )
+        except Exception as e:
+            if str(e).startswith(_BAD_REQUEST_ERROR):
+                # One malformed ID rejects the whole batch; asking for each paper
+                # separately confines the error to the caller that sent it
+                results = await _fetch_papers_individually(paper_ids, params)
+            else:
+                results = [e] * len(paper_ids)
+        else:
+            results = []
+            # The batch endpoint returns null in place of unknown IDs
+            for paper_id, paper in zip(paper_ids, papers, strict=True):
+                if paper is None:
+                    results.append(
+                        httpx.HTTPError(f"Resource not found (404): /graph/v1/paper/{paper_id}")
+                    )
+                    continue
+                body = orjson.dumps(paper)
+                # Store it where later lookups of this one paper will find it
+                _cache_put(_paper_cache_key(paper_id, params), body)
+                results.append(body)
+
+    for paper_id, result in zip(paper_ids, results, strict=True):
+        for future in group[paper_id]:
+            if future.done():  # caller was cancelled
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
 # MCP Tools Implementation
 
 @mcp.tool()
@@ -196,7 +657,7 @@ async def search_papers(
     publication_types: Optional[str] = None,
     publication_date_or_year: Optional[str] = None,
     min_citation_count: Optional[int] = None,
-    ctx: Optional[Context] = None,
+    ctx: Context = None,
 ) -> str:
     """
     Search for academic papers using the Semantic Scholar API.
@@ -220,36 +681,24 @@ async def search_papers(
     Returns:
         JSON string containing search results with metadata
     """
-    if ctx:
-        ctx.info(f"🔍 Searching papers for query: '{query}'")
-
     # Validate parameters
     if not query or not query.strip():
         error_msg = "Query parameter is required and cannot be empty"
         if ctx:
-            ctx.info(f"❌ Parameter validation failed: {error_msg}")
-        return json.dumps({"error": error_msg, "parameter": "query"})
+            await ctx.info(f"❌ Parameter validation failed: {error_msg}")
+        return _error_response(error_msg, parameter="query")
 
     if limit < 1 or limit > 100:
         error_msg = "Limit must be between 1 and 100"
         if ctx:
-            ctx.info(f"❌ Parameter validation failed: {error_msg}")
-        return json.dumps({"error": error_msg, "parameter": "limit", "value": limit})
+            await ctx.info(f"❌ Parameter validation failed: {error_msg}")
+        return _error_response(error_msg, parameter="limit", value=limit)
 
     if offset < 0:
         error_msg = "Offset must be non-negative"
         if ctx:
-            ctx.info(f"❌ Parameter validation failed: {error_msg}")
-        return json.dumps({"error": error_msg, "parameter": "offset", "value": offset})
-
-    # Valid field names for Semantic Scholar API
-    valid_fields = {
-        "paperId", "title", "abstract", "venue", "year", "referenceCount", 
-        "citationCount", "influentialCitationCount", "isOpenAccess", 
-        "fieldsOfStudy", "s2FieldsOfStudy", "publicationTypes", 
-        "publicationDate", "journal", "authors", "citations", "references",
-        "url", "publicationVenue", "externalIds", "openAccessPdf"
-    }
+            await ctx.info(f"❌ Parameter validation failed: {error_msg}")
+        return _error_response(error_msg, parameter="offset", value=offset)
 
     # Build API parameters using correct parameter names
     params = {
@@ -260,13 +709,13 @@ async def search_papers(
 
     if fields:
         # Validate field names
-        requested_fields = [f.strip() for f in fields.split(",")]
-        invalid_fields = [f for f in requested_fields if f not in valid_fields]
+        requested_fields = {f.strip() for f in fields.split(",")}
+        invalid_fields = sorted(requested_fields - _VALID_PAPER_FIELDS)
         if invalid_fields:
-            error_msg = f"Invalid field names: {invalid_fields}. Valid fields: {sorted(valid_fields)}"
+            error_msg = f"Invalid field names: {invalid_fields}. Valid fields: {_VALID_PAPER_FIELDS_SORTED}"
             if ctx:
-                ctx.info(f"❌ Field validation failed: {error_msg}")
-            return json.dumps({"error": error_msg, "parameter": "fields", "invalid_fields": invalid_fields})
+                await ctx.info(f"❌ Field validation failed: {error_msg}")
+            return _error_response(error_msg, parameter="fields", invalid_fields=invalid_fields)
         params["fields"] = fields
 
     if publication_types:
@@ -279,17 +728,13 @@ async def search_papers(
         if not date_str:
             error_msg = "Publication date/year cannot be empty"
             if ctx:
-                ctx.info(f"❌ Date validation failed: {error_msg}")
-            return json.dumps({"error": error_msg, "parameter": "publication_date_or_year"})
+                await ctx.info(f"❌ Date validation failed: {error_msg}")
+            return _error_response(error_msg, parameter="publication_date_or_year")
         
         # Convert format like "2024-2025" to "2024:2025"
-        if "-" in date_str and ":" not in date_str:
-            # Check if it looks like a range (e.g., "2024-2025")
-            parts = date_str.split("-")
-            if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit() and len(parts[0]) == 4 and len(parts[1]) == 4:
-                date_str = f"{parts[0]}:{parts[1]}"
-                if ctx:
-                    ctx.info(f"📅 Converted date range format: '{publication_date_or_year}' → '{date_str}'")
+        year_range = _YEAR_RANGE_RE.fullmatch(date_str)
+        if year_range:
+            date_str = f"{year_range[1]}:{year_range[2]}"
         
         params["publicationDateOrYear"] = date_str
 
@@ -297,56 +742,47 @@ async def search_papers(
         if min_citation_count < 0:
             error_msg = "Minimum citation count must be non-negative"
             if ctx:
-                ctx.info(f"❌ Parameter validation failed: {error_msg}")
-            return json.dumps({"error": error_msg, "parameter": "min_citation_count", "value": min_citation_count})
+                await ctx.info(f"❌ Parameter validation failed: {error_msg}")
+            return _error_response(error_msg, parameter="min_citation_count", value=min_citation_count)
         params["minCitationCount"] = min_citation_count
 
-    if ctx:
-        ctx.info(f"📋 API request parameters: {params}")
-
     try:
-        result = await make_api_request("/graph/v1/paper/search", params)
-
-        if ctx:
-            total = result.get("total", 0)
-            returned = len(result.get("data", []))
-            ctx.info(f"✅ Found {total} papers, returning {returned}")
+        raw = await make_api_request("/graph/v1/paper/search", params, raw=True)
 
-        # Add metadata to response
-        result["_metadata"] = {
+        metadata = {
             "query": query,
             "parameters_used": params,
             "api_endpoint": "/graph/v1/paper/search"
         }
-
-        return json.dumps(result, indent=2)
+        return _append_metadata(raw, metadata).decode()
 
     except httpx.HTTPError as e:
         error_msg = f"API request failed: {str(e)}"
         if ctx:
-            ctx.info(f"❌ HTTP error: {error_msg}")
+            await ctx.info(f"❌ HTTP error: {error_msg}")
         logger.error(f"HTTP error in search_papers: {error_msg}")
-        return json.dumps({
-            "error": error_msg,
-            "query": query,
-            "parameters": params,
-            "suggestion": "Check API parameters format and try again"
-        })
+        return _error_response(
+            error_msg,
+            query=query,
+            parameters=params,
+            suggestion="Check API parameters format and try again",
+        )
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}"
         if ctx:
-            ctx.info(f"❌ Unexpected error: {error_msg}")
+            await ctx.info(f"❌ Unexpected error: {error_msg}")
         logger.error(f"Unexpected error in search_papers: {error_msg}")
-        return json.dumps({
-            "error": error_msg,
-            "query": query,
-            "suggestion": "Please report this error to the server administrator"
-        })
+        return _error_response(
+            error_msg,
+            query=query,
+            suggestion="Please report this error to the server administrator",
+        )
 
 
 @mcp.tool()
+@_with_error_envelope("fetching paper details")
 async def get_paper_details(
-    paper_id: str, fields: Optional[str] = None, ctx: Optional[Context] = None
+    paper_id: str, fields: Optional[str] = None, ctx: Context = None
 ) -> str:
     """
     Get detailed information about a specific paper.
@@ -358,35 +794,59 @@ async def get_paper_details(
     Returns:
         JSON string containing paper details
     """
-    if ctx:
-        ctx.info(f"Fetching paper details for ID: {paper_id}")
+    raw = await _fetch_paper(paper_id, fields)
 
-    params = {}
-    if fields:
-        params["fields"] = fields
+    return raw.decode()
 
-    try:
-        result = await make_api_request(f"/graph/v1/paper/{paper_id}", params)
 
-        if ctx:
-            title = result.get("title", "Unknown")
-            ctx.info(f"Retrieved paper: {title}")
+@mcp.tool()
+@_with_error_envelope("fetching paper batch")
+async def get_papers_batch(
+    paper_ids: List[str], fields: Optional[str] = None, ctx: Context = None
+) -> str:
+    """
+    Get details for several papers in a single API request.
 
-        return json.dumps(result, indent=2)
+    Prefer this over calling get_paper_details once per paper: the whole
+    batch costs one round-trip and one rate limit slot.
 
-    except Exception as e:
-        error_msg = f"Error fetching paper details: {str(e)}"
-        logger.error(error_msg)
-        return json.dumps({"error": error_msg})
+    Args:
+        paper_ids: Semantic Scholar paper IDs or external IDs (up to 500)
+        fields: Comma-separated list of fields to return
+
+    Returns:
+        JSON string containing a list of paper details (null for unknown IDs)
+    """
+    if not paper_ids:
+        return _error_response("paper_ids cannot be empty", parameter="paper_ids")
+    if len(paper_ids) > MAX_BATCH_PAPER_IDS:
+        return _error_response(
+            f"At most {MAX_BATCH_PAPER_IDS} paper IDs can be requested at once",
+            parameter="paper_ids",
+            value=len(paper_ids),
+        )
+
+    params = _build_params(fields=fields)
+
+    raw = await make_api_request(
+        "/graph/v1/paper/batch",
+        params,
+        method="POST",
+        json_body={"ids": list(paper_ids)},
+        raw=True,
+    )
+
+    return raw.decode()
 
 
 @mcp.tool()
+@_with_error_envelope("fetching paper authors")
 async def get_paper_authors(
     paper_id: str,
     fields: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
-    ctx: Optional[Context] = None,
+    ctx: Context = None,
 ) -> str:
     """
     Get authors of a specific paper.
@@ -400,35 +860,21 @@ async def get_paper_authors(
     Returns:
         JSON string containing author information
     """
-    if ctx:
-        ctx.info(f"Fetching authors for paper ID: {paper_id}")
-
-    params = {"limit": limit, "offset": offset}
-    if fields:
-        params["fields"] = fields
-
-    try:
-        result = await make_api_request(f"/graph/v1/paper/{paper_id}/authors", params)
-
-        if ctx:
-            count = len(result.get("data", []))
-            ctx.info(f"Retrieved {count} authors")
+    params = _build_params(limit=limit, offset=offset, fields=fields)
 
-        return json.dumps(result, indent=2)
+    raw = await make_api_request(f"/graph/v1/paper/{paper_id}/authors", params, raw=True)
 
-    except Exception as e:
-        error_msg = f"Error fetching paper authors: {str(e)}"
-        logger.error(error_msg)
-        return json.dumps({"error": error_msg})
+    return raw.decode()
 
 
 @mcp.tool()
+@_with_error_envelope("fetching paper citations")
 async def get_paper_citations(
     paper_id: str,
     fields: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
-    ctx: Optional[Context] = None,
+    ctx: Context = None,
 ) -> str:
     """
     Get citations of a specific paper.
@@ -442,35 +888,21 @@ async def get_paper_citations(
     Returns:
         JSON string containing citation information
     """
-    if ctx:
-        ctx.info(f"Fetching citations for paper ID: {paper_id}")
-
-    params = {"limit": limit, "offset": offset}
-    if fields:
-        params["fields"] = fields
+    params = _build_params(limit=limit, offset=offset, fields=fields)
 
-    try:
-        result = await make_api_request(f"/graph/v1/paper/{paper_id}/citations", params)
-
-        if ctx:
-            count = len(result.get("data", []))
-            ctx.info(f"Retrieved {count} citations")
+    raw = await make_api_request(f"/graph/v1/paper/{paper_id}/citations", params, raw=True)
 
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        error_msg = f"Error fetching paper citations: {str(e)}"
-        logger.error(error_msg)
-        return json.dumps({"error": error_msg})
+    return raw.decode()
 
 
 @mcp.tool()
+@_with_error_envelope("fetching paper references")
 async def get_paper_references(
     paper_id: str,
     fields: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
-    ctx: Optional[Context] = None,
+    ctx: Context = None,
 ) -> str:
     """
     Get references of a specific paper.
@@ -484,37 +916,21 @@ async def get_paper_references(
     Returns:
         JSON string containing reference information
     """
-    if ctx:
-        ctx.info(f"Fetching references for paper ID: {paper_id}")
-
-    params = {"limit": limit, "offset": offset}
-    if fields:
-        params["fields"] = fields
+    params = _build_params(limit=limit, offset=offset, fields=fields)
 
-    try:
-        result = await make_api_request(
-            f"/graph/v1/paper/{paper_id}/references", params
-        )
+    raw = await make_api_request(f"/graph/v1/paper/{paper_id}/references", params, raw=True)
 
-        if ctx:
-            count = len(result.get("data", []))
-            ctx.info(f"Retrieved {count} references")
-
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        error_msg = f"Error fetching paper references: {str(e)}"
-        logger.error(error_msg)
-        return json.dumps({"error": error_msg})
+    return raw.decode()
 
 
 @mcp.tool()
+@_with_error_envelope("searching authors")
 async def search_authors(
     query: str,
     limit: int = 10,
     offset: int = 0,
     fields: Optional[str] = None,
-    ctx: Optional[Context] = None,
+    ctx: Context = None,
 ) -> str:
     """
     Search for authors using the Semantic Scholar API.
@@ -528,33 +944,17 @@ async def search_authors(
     Returns:
         JSON string containing search results
     """
-    if ctx:
-        ctx.info(f"Searching authors for query: {query}")
+    params = _build_params(query=query, limit=min(limit, 100), offset=offset, fields=fields)
 
-    params = {"query": query, "limit": min(limit, 100), "offset": offset}
+    raw = await make_api_request("/graph/v1/author/search", params, raw=True)
 
-    if fields:
-        params["fields"] = fields
-
-    try:
-        result = await make_api_request("/graph/v1/author/search", params)
-
-        if ctx:
-            total = result.get("total", 0)
-            returned = len(result.get("data", []))
-            ctx.info(f"Found {total} authors, returning {returned}")
-
-        return json.dumps(result, indent=2)
-
-    except Exception as e:
-        error_msg = f"Error searching authors: {str(e)}"
-        logger.error(error_msg)
-        return json.dumps({"error": error_msg})
+    return raw.decode()
 
 
 @mcp.tool()
+@_with_error_envelope("fetching author details")
 async def get_author_details(
-    author_id: str, fields: Optional[str] = None, ctx: Optional[Context] = None
+    author_id: str, fields: Optional[str] = None, ctx: Context = None
 ) -> str:
     """
     Get detailed information about a specific author.
@@ -566,35 +966,21 @@ async def get_author_details(
     Returns:
         JSON string containing author details
     """
-    if ctx:
-        ctx.info(f"Fetching author details for ID: {author_id}")
-
-    params = {}
-    if fields:
-        params["fields"] = fields
-
-    try:
-        result = await make_api_request(f"/graph/v1/author/{author_id}", params)
+    params = _build_params(fields=fields)
 
-        if ctx:
-            name = result.get("name", "Unknown")
-            ctx.info(f"Retrieved author: {name}")
-
-        return json.dumps(result, indent=2)
+    raw = await make_api_request(f"/graph/v1/author/{author_id}", params, raw=True)
 
-    except Exception as e:
-        error_msg = f"Error fetching author details: {str(e)}"
-        logger.error(error_msg)
-        return json.dumps({"error": error_msg})
+    return raw.decode()
 
 
 @mcp.tool()
+@_with_error_envelope("fetching author papers")
 async def get_author_papers(
     author_id: str,
     fields: Optional[str] = None,
     limit: int = 100,
     offset: int = 0,
-    ctx: Optional[Context] = None,
+    ctx: Context = None,
 ) -> str:
     """
     Get papers by a specific author.
@@ -608,33 +994,58 @@ async def get_author_papers(
     Returns:
         JSON string containing author's papers
     """
-    if ctx:
-        ctx.info(f"Fetching papers for author ID: {author_id}")
+    params = _build_params(limit=limit, offset=offset, fields=fields)
 
-    params = {"limit": limit, "offset": offset}
-    if fields:
-        params["fields"] = fields
+    raw = await make_api_request(f"/graph/v1/author/{author_id}/papers", params, raw=True)
 
-    try:
-        result = await make_api_request(f"/graph/v1/author/{author_id}/papers", params)
+    return raw.decode()
 
-        if ctx:
-            count = len(result.get("data", []))
-            ctx.info(f"Retrieved {count} papers")
 
-        return json.dumps(result, indent=2)
+@mcp.tool()
+@_with_error_envelope("fetching author profile")
+async def get_author_full_profile(
+    author_id: str,
+    author_fields: Optional[str] = None,
+    paper_fields: Optional[str] = None,
+    limit: int = 100,
+    ctx: Context = None,
+) -> str:
+    """
+    Get an author's details and papers in one call.
 
-    except Exception as e:
-        error_msg = f"Error fetching author papers: {str(e)}"
-        logger.error(error_msg)
-        return json.dumps({"error": error_msg})
+    Both lookups are sent concurrently, replacing a get_author_details call
+    followed by a get_author_papers call.
+
+    Args:
+        author_id: Semantic Scholar author ID
+        author_fields: Comma-separated list of author fields to return
+        paper_fields: Comma-separated list of paper fields to return
+        limit: Number of papers to return
+
+    Returns:
+        JSON string with "details" and "papers" keys
+    """
+    details, papers = await asyncio.gather(
+        make_api_request(
+            f"/graph/v1/author/{author_id}", _build_params(fields=author_fields), raw=True
+        ),
+        make_api_request(
+            f"/graph/v1/author/{author_id}/papers",
+            _build_params(limit=limit, fields=paper_fields),
+            raw=True,
+        ),
+    )
+
+    return b"".join((b'{"details":', details, b',"papers":', papers, b"}")).decode()
 
 
 # MCP Resources Implementation
 
-@mcp.resource("semantic-scholar://api-info")
-async def get_api_info() -> str:
-    """Get information about the Semantic Scholar API configuration."""
+# Resource payloads only depend on immutable settings, so each is serialized once
+
+@functools.lru_cache(maxsize=1)
+def _api_info_json() -> str:
+    """Build the api-info resource payload."""
     info = {
         "api_base_url": settings.semantic_scholar_base_url,
         "has_api_key": bool(settings.semantic_scholar_api_key),
@@ -646,33 +1057,11 @@ async def get_api_info() -> str:
     return json.dumps(info, indent=2)
 
 
-@mcp.resource("semantic-scholar://available-fields")
-async def get_available_fields() -> str:
-    """Get information about available fields for API requests."""
+@functools.lru_cache(maxsize=1)
+def _available_fields_json() -> str:
+    """Build the available-fields resource payload."""
     fields_info = {
-        "paper_fields": [
-            "paperId",
-            "title",
-            "abstract",
-            "venue",
-            "year",
-            "referenceCount",
-            "citationCount",
-            "influentialCitationCount",
-            "isOpenAccess",
-            "fieldsOfStudy",
-            "s2FieldsOfStudy",
-            "publicationTypes",
-            "publicationDate",
-            "journal",
-            "authors",
-            "citations",
-            "references",
-            "url",
-            "publicationVenue",
-            "externalIds",
-            "openAccessPdf"
-        ],
+        "paper_fields": list(PAPER_FIELDS),
         "author_fields": [
             "authorId",
             "name",
@@ -698,12 +1087,9 @@ async def get_available_fields() -> str:
     return json.dumps(fields_info, indent=2)
 
 
-@mcp.resource("semantic-scholar://ai-agent-guidelines")
-async def get_ai_agent_guidelines() -> str:
-    """
-    Comprehensive guidelines for AI agents using this Semantic Scholar MCP server.
-    This resource provides clear instructions on parameter formats, best practices, and common pitfalls.
-    """
+@functools.lru_cache(maxsize=1)
+def _ai_agent_guidelines_json() -> str:
+    """Build the ai-agent-guidelines resource payload."""
     guidelines = {
         "overview": {
             "description": "Semantic Scholar MCP Server provides access to academic paper search and retrieval",
@@ -790,6 +1176,22 @@ async def get_ai_agent_guidelines() -> str:
                         "examples": ["649def34f8be52c8b66281af98ae884c09aef38b", "10.1038/nature14539", "1506.02142"]
                     }
                 }
+            },
+            "get_papers_batch": {
+                "description": "Get details for up to 500 papers in one request",
+                "required_parameters": ["paper_ids"],
+                "parameter_guidelines": {
+                    "paper_ids": {
+                        "type": "array of strings",
+                        "required": True,
+                        "description": "Semantic Scholar paper IDs or external IDs (DOI, ArXiv, etc.)",
+                        "examples": [["649def34f8be52c8b66281af98ae884c09aef38b", "10.1038/nature14539"]]
+                    }
+                },
+                "best_practices": [
+                    "Use instead of calling get_paper_details once per paper",
+                    "Unknown IDs come back as null entries in the same position"
+                ]
             }
         },
         "resources": {
@@ -806,14 +1208,14 @@ async def get_ai_agent_guidelines() -> str:
             "basic_search": {
                 "step_1": "search_papers with query='machine learning' and basic fields",
                 "step_2": "Review results and select interesting papers",
-                "step_3": "get_paper_details for specific papers",
+                "step_3": "get_papers_batch for the selected papers (one request instead of repeated get_paper_details calls)",
                 "step_4": "get_paper_citations or get_paper_references for related work"
             },
             "comprehensive_research": {
                 "step_1": "search_papers with specific query and date filter",
                 "step_2": "Analyze top papers by citation count",
-                "step_3": "get_author_details for key researchers",
-                "step_4": "get_author_papers for their other work",
+                "step_3": "get_author_full_profile for key researchers",
+                "step_4": "Review their other work from the returned papers",
                 "step_5": "Synthesize findings into research overview"
             }
         },
@@ -850,6 +1252,27 @@ async def get_ai_agent_guidelines() -> str:
     return json.dumps(guidelines, indent=2)
 
 
+@mcp.resource("semantic-scholar://api-info")
+async def get_api_info() -> str:
+    """Get information about the Semantic Scholar API configuration."""
+    return _api_info_json()
+
+
+@mcp.resource("semantic-scholar://available-fields")
+async def get_available_fields() -> str:
+    """Get information about available fields for API requests."""
+    return _available_fields_json()
+
+
+@mcp.resource("semantic-scholar://ai-agent-guidelines")
+async def get_ai_agent_guidelines() -> str:
+    """
+    Comprehensive guidelines for AI agents using this Semantic Scholar MCP server.
+    This resource provides clear instructions on parameter formats, best practices, and common pitfalls.
+    """
+    return _ai_agent_guidelines_json()
+
+
 # MCP Prompts Implementation
 
 @mcp.prompt()
@@ -870,20 +1293,23 @@ Use the search_papers tool to find relevant papers, then analyze the results to
     return base_prompt
 
 
+# The fixed turns of paper_analysis_prompt are validated once, not on every render
+_ANALYSIS_ASSISTANT_MESSAGE = base.AssistantMessage(
+    "I'll help you analyze this paper. Let me retrieve the paper details first, then provide a comprehensive analysis."
+)
+_ANALYSIS_INSTRUCTIONS_MESSAGE = base.UserMessage(
+    "Please use the get_paper_details tool to fetch the paper information, then provide insights based on the analysis type requested."
+)
+
+
 @mcp.prompt()
 def paper_analysis_prompt(paper_id: str, analysis_type: str = "summary") -> list:
     """Generate a prompt for analyzing a specific paper."""
-    from mcp.server.fastmcp.prompts import base
-    
     return [
         base.UserMessage(f"I need to analyze paper ID: {paper_id}"),
         base.UserMessage(f"Analysis type: {analysis_type}"),
-        base.AssistantMessage(
-            "I'll help you analyze this paper. Let me retrieve the paper details first, then provide a comprehensive analysis."
-        ),
-        base.UserMessage(
-            "Please use the get_paper_details tool to fetch the paper information, then provide insights based on the analysis type requested."
-        ),
+        _ANALYSIS_ASSISTANT_MESSAGE,
+        _ANALYSIS_INSTRUCTIONS_MESSAGE,
     ]
 
 
@@ -896,7 +1322,7 @@ Research focus: {research_focus}
 
 Please help me:
 1. Find the author using search_authors
-2. Get detailed information about their work
+2. Get their details and papers together using get_author_full_profile
 3. Analyze their most cited papers
 4. Identify their research areas and contributions
 5. Provide a comprehensive overview of their academic profile
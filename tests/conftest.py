@@ -0,0 +1,143 @@
+"""Shared fixtures for the Semantic Scholar MCP Server tests."""
+
+import asyncio
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+import orjson
+import pytest
+
+# uvloop is a dev dependency everywhere except Windows, where it does not build
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the async tests on uvloop when it is available"""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+class StdioServer:
+    """A stdio MCP server subprocess that tests exchange JSON-RPC lines with"""
+
+    # Generous enough for a live tools/call including its retries
+    RESPONSE_TIMEOUT = 30
+
+    def __init__(self, process: subprocess.Popen):
+        self.process = process
+        self._next_id = 0
+        self.initialize_result = None
+        # Reader threads keep both pipes drained, so reads can time out and a
+        # chatty stderr can never block the server
+        self._lines = queue.Queue()
+        self._stderr = deque(maxlen=200)
+        self._readers = [
+            threading.Thread(target=self._read_stdout, daemon=True),
+            threading.Thread(target=self._read_stderr, daemon=True),
+        ]
+        for reader in self._readers:
+            reader.start()
+
+    def send(self, method: str, params: dict = None) -> dict:
+        """Send a request and return the response carrying its id"""
+        self._next_id += 1
+        request_id = self._next_id
+        self._write({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}})
+        deadline = time.monotonic() + self.RESPONSE_TIMEOUT
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                line = None
+            if line is None:
+                self._fail(f"no response to {method} within {self.RESPONSE_TIMEOUT}s")
+            if not line:
+                self._fail(f"server exited with code {self.process.poll()} while awaiting {method}")
+            # orjson parses the raw bytes; binary pipes skip the text I/O layer
+            message = orjson.loads(line)
+            # Skip server notifications (logging etc.) interleaved with responses
+            if message.get("id") == request_id:
+                return message
+
+    def close(self) -> None:
+        """Stop the server and release its pipes"""
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        # The readers stop at EOF once the process is gone; only then close their pipes
+        for reader in self._readers:
+            reader.join(timeout=5)
+        self.process.stdout.close()
+        self.process.stderr.close()
+
+    def notify(self, method: str, params: dict = None) -> None:
+        """Send a notification; the server sends no response"""
+        self._write({"jsonrpc": "2.0", "method": method, "params": params or {}})
+
+    def _write(self, message: dict) -> None:
+        try:
+            self.process.stdin.write(orjson.dumps(message) + b"\n")
+            self.process.stdin.flush()
+            return
+        except BrokenPipeError:
+            pass
+        self._fail(f"server exited with code {self.process.wait()} before {message['method']}")
+
+    def _read_stdout(self) -> None:
+        for line in self.process.stdout:
+            self._lines.put(line)
+        self._lines.put(b"")  # EOF
+
+    def _read_stderr(self) -> None:
+        for line in self.process.stderr:
+            self._stderr.append(line.decode(errors="replace"))
+
+    def _fail(self, reason: str):
+        stderr = "".join(self._stderr) or "(empty)\n"
+        pytest.fail(f"stdio server: {reason}\n--- server stderr (tail) ---\n{stderr}", pytrace=False)
+
+
+@pytest.fixture(scope="session")
+def mcp_server():
+    """Start one initialized stdio server for the whole test session"""
+    # The child inherits the environment at spawn, so the override only has
+    # to last for the Popen call
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MCP_TRANSPORT", "stdio")
+        process = subprocess.Popen(
+            [sys.executable, "server.py", "--transport", "stdio"],
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    server = StdioServer(process)
+    try:
+        server.initialize_result = server.send("initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "test-client", "version": "1.0"}
+        })
+        server.notify("notifications/initialized")
+        yield server
+    finally:
+        server.close()
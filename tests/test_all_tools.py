@@ -1,115 +1,142 @@
 #!/usr/bin/env python3
+import asyncio
 import json
-import subprocess
-import os
-
-def test_individual_tools():
-    """Test each MCP tool individually"""
-    env = os.environ.copy()
-    env["SEMANTIC_SCHOLAR_API_KEY"] = "SGEs5LaI8C5vd1mWLvi42aWCK35gZR5ak7bkbNC0"
-    
-    # Test cases for different tools
-    test_cases = [
-        {
-            "name": "search_papers",
-            "description": "Search for machine learning papers",
-            "arguments": {
-                "query": "neural networks",
-                "limit": 3,
-                "fields": "title,year,citationCount"
-            }
+
+import httpx
+import orjson
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+from unittest.mock import patch
+
+import server
+from server import mcp
+
+# Test cases for different tools
+TEST_CASES = [
+    {
+        "name": "search_papers",
+        "description": "Search for machine learning papers",
+        "arguments": {
+            "query": "neural networks",
+            "limit": 3,
+            "fields": "title,year,citationCount"
+        },
+        "expected": {"total": 1, "data": [{"title": "x", "year": 2024, "citationCount": 0}]}
+    },
+    {
+        "name": "get_paper_details",
+        "description": "Get details for a specific paper",
+        "arguments": {
+            "paper_id": "649def34f8be52c8b66281af98ae884c09aef38b",
+            "fields": "title,abstract,year,authors"
+        },
+        "expected": {"paperId": "649def34f8be52c8b66281af98ae884c09aef38b", "title": "x"}
+    },
+    {
+        "name": "get_papers_batch",
+        "description": "Get details for several papers at once",
+        "arguments": {
+            "paper_ids": ["649def34f8be52c8b66281af98ae884c09aef38b", "unknown"],
+            "fields": "title"
+        },
+        "expected": [{"paperId": "649def34f8be52c8b66281af98ae884c09aef38b", "title": "x"}, None]
+    },
+    {
+        "name": "search_authors",
+        "description": "Search for authors",
+        "arguments": {
+            "query": "Geoffrey Hinton",
+            "limit": 2,
+            "fields": "name,affiliations,hIndex"
         },
-        {
-            "name": "get_paper_details", 
-            "description": "Get details for a specific paper",
-            "arguments": {
-                "paper_id": "649def34f8be52c8b66281af98ae884c09aef38b",
-                "fields": "title,abstract,year,authors"
-            }
+        "expected": {"total": 1, "data": [{"name": "Geoffrey Hinton", "hIndex": 1}]}
+    },
+    {
+        "name": "get_author_full_profile",
+        "description": "Get an author's details and papers together",
+        "arguments": {
+            "author_id": "1741101",
+            "limit": 2
         },
-        {
-            "name": "search_authors",
-            "description": "Search for authors",
-            "arguments": {
-                "query": "Geoffrey Hinton",
-                "limit": 2,
-                "fields": "name,affiliations,hIndex"
-            }
+        "expected": {
+            "details": {"authorId": "1741101", "name": "Oren Etzioni"},
+            "papers": {"data": [{"paperId": "p1", "title": "x"}]}
         }
-    ]
-    
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n{'='*50}")
-        print(f"Test {i}: {test_case['description']}")
-        print(f"Tool: {test_case['name']}")
-        print(f"{'='*50}")
-        
-        process = subprocess.Popen(
-            ["uv", "run", "python", "server_stdio.py"],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            env=env
-        )
-        
-        messages = [
-            {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "initialize",
-                "params": {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {},
-                    "clientInfo": {"name": "test-client", "version": "1.0"}
-                }
-            },
-            {
-                "jsonrpc": "2.0",
-                "method": "notifications/initialized",
-                "params": {}
-            },
-            {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/call",
-                "params": {
-                    "name": test_case["name"],
-                    "arguments": test_case["arguments"]
-                }
-            }
-        ]
-        
-        input_data = "\n".join([json.dumps(msg) for msg in messages]) + "\n"
-        
-        try:
-            stdout, stderr = process.communicate(input=input_data, timeout=20)
-            
-            print(f"Arguments: {test_case['arguments']}")
-            
-            # Parse and display results
-            lines = stdout.strip().split('\n')
-            for line in lines:
-                if line.strip():
-                    try:
-                        response = json.loads(line)
-                        if response.get('id') == 2:  # Tool call response
-                            result = response.get('result', {})
-                            if 'result' in result:
-                                # Parse the JSON result from tool
-                                tool_result = json.loads(result['result'])
-                                print(f"Success: {json.dumps(tool_result, indent=2)[:500]}...")
-                            elif 'error' in response:
-                                print(f"Error: {response['error']}")
-                    except json.JSONDecodeError:
-                        continue
-            
-            if stderr and "INFO:" not in stderr:
-                print(f"Warnings/Errors: {stderr[:200]}...")
-                
-        except subprocess.TimeoutExpired:
-            process.kill()
-            print("Timeout expired")
+    }
+]
+
+# Canned Semantic Scholar responses, keyed by request path
+API_RESPONSES = {
+    "/graph/v1/paper/search": TEST_CASES[0]["expected"],
+    "/graph/v1/paper/649def34f8be52c8b66281af98ae884c09aef38b": TEST_CASES[1]["expected"],
+    "/graph/v1/paper/batch": TEST_CASES[2]["expected"],
+    "/graph/v1/author/search": TEST_CASES[3]["expected"],
+    "/graph/v1/author/1741101": TEST_CASES[4]["expected"]["details"],
+    "/graph/v1/author/1741101/papers": TEST_CASES[4]["expected"]["papers"],
+}
+
+
+def mock_api(request):
+    """Serve canned API responses so the test never touches the network"""
+    if request.url.path not in API_RESPONSES:
+        return httpx.Response(404, json={"error": "Not found"})
+    return httpx.Response(200, json=API_RESPONSES[request.url.path])
+
+
+@pytest.mark.asyncio
+async def test_individual_tools():
+    """Test each MCP tool individually over an in-process MCP session"""
+    server.clear_response_cache()
+    client = httpx.AsyncClient(
+        base_url=server.settings.semantic_scholar_base_url,
+        transport=httpx.MockTransport(mock_api),
+    )
+    log_messages = []
+
+    async def collect_log(params):
+        log_messages.append(params)
+
+    # One in-memory client/server pair replaces a server subprocess per case
+    async with client, create_connected_server_and_client_session(
+        mcp._mcp_server, logging_callback=collect_log
+    ) as session:
+        with patch("server.http_client", client), patch("server._rate_limit_delay", 0.0), \
+                patch("server._next_send_ts", 0.0):
+            for i, test_case in enumerate(TEST_CASES, 1):
+                await _run_test_case(session, i, test_case)
+    server.clear_response_cache()
+
+    # Successful calls send no log notifications; only failures are reported
+    assert log_messages == []
+
+
+@pytest.mark.asyncio
+async def test_context_hidden_from_tool_schemas():
+    """Test that FastMCP injects ctx instead of exposing it as a tool argument"""
+    async with create_connected_server_and_client_session(mcp._mcp_server) as session:
+        tools = (await session.list_tools()).tools
+
+    for tool in tools:
+        assert "ctx" not in tool.inputSchema["properties"], tool.name
+        assert "$defs" not in tool.inputSchema, tool.name
+
+
+async def _run_test_case(session, i, test_case):
+    print(f"\n{'='*50}")
+    print(f"Test {i}: {test_case['description']}")
+    print(f"Tool: {test_case['name']}")
+    print(f"{'='*50}")
+    print(f"Arguments: {test_case['arguments']}")
+
+    result = await session.call_tool(test_case["name"], test_case["arguments"])
+
+    assert not result.isError, result.content
+    tool_result = orjson.loads(result.content[0].text)
+    print(f"Success: {json.dumps(tool_result, indent=2)[:500]}...")
+    if isinstance(tool_result, dict):
+        tool_result.pop("_metadata", None)
+    assert tool_result == test_case["expected"]
+
 
 if __name__ == "__main__":
-    test_individual_tools()
\ No newline at end of file
+    asyncio.run(test_individual_tools())
@@ -5,22 +5,100 @@ This module contains comprehensive tests for all server functionality including
 tools, resources, prompts, and error handling.
 """
 
+import asyncio
+import shutil
+import subprocess
+import sys
 import pytest
 import json
-from unittest.mock import AsyncMock, patch, MagicMock
+import orjson
+import pytest_asyncio
+from unittest.mock import AsyncMock, patch
 import httpx
 
 # Import server components
+import config
+import server
 from server import (
+    _append_metadata,
+    _requests_open_access_pdf,
+    _strip_disclaimers_inplace,
+    clear_response_cache,
     make_api_request,
     init_http_client,
     close_http_client,
     search_papers,
     get_paper_details,
+    get_papers_batch,
     search_authors,
     get_author_details,
+    get_author_full_profile,
 )
-from config import settings
+from config import (
+    TRANSPORT_STDIO,
+    TRANSPORT_STREAMABLE_HTTP,
+    Settings,
+    settings,
+    get_rate_limit_delay,
+    get_settings,
+    get_semantic_scholar_headers,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_response_cache():
+    """Ensure cached API responses never leak between tests."""
+    clear_response_cache()
+    yield
+    clear_response_cache()
+
+
+class _MockAPI:
+    """Canned Semantic Scholar API served to the real client through httpx.MockTransport."""
+
+    def __init__(self):
+        self.requests = []
+        self._responses = []
+        self.sleep = AsyncMock()
+
+    def respond(self, *responses):
+        """
+        Queue responses in order; the last one keeps answering once the rest are used.
+
+        Each response is an httpx.Response, a JSON payload for a 200 response, or a
+        callable taking the httpx.Request and returning either of those.
+        """
+        self._responses.extend(responses)
+
+    def handle(self, request):
+        """MockTransport handler: record the request and answer with the next response."""
+        self.requests.append(request)
+        response = self._responses.pop(0) if len(self._responses) > 1 else self._responses[0]
+        if callable(response):
+            response = response(request)
+        if not isinstance(response, httpx.Response):
+            response = httpx.Response(200, json=response)
+        return response
+
+
+@pytest_asyncio.fixture
+async def mock_api(monkeypatch):
+    """Point the server's HTTP client at a _MockAPI and skip rate limit/retry waits."""
+    api = _MockAPI()
+    client = httpx.AsyncClient(
+        base_url=settings.semantic_scholar_base_url,
+        transport=httpx.MockTransport(api.handle),
+    )
+    monkeypatch.setattr("server.http_client", client)
+    monkeypatch.setattr("server._sleep", api.sleep)
+    async with client:
+        yield api
+
+
+def _expire_cache():
+    """Age every cached response past the TTL."""
+    for key, (_, result, etag) in list(server._response_cache.items()):
+        server._response_cache[key] = (float("-inf"), result, etag)
 
 
 class TestConfiguration:
@@ -32,11 +110,84 @@ class TestConfiguration:
         assert settings.semantic_scholar_base_url
         assert settings.mcp_server_port > 0
 
+    @pytest.mark.integration
     def test_api_key_configured(self):
         """Test that API key is configured (for development)."""
-        # In production, you might want to skip this test
         assert settings.semantic_scholar_api_key
 
+    def test_settings_singleton(self):
+        """Test that settings are constructed once and shared."""
+        assert get_settings() is get_settings()
+        assert settings is get_settings()
+
+    def test_env_file_loaded(self, tmp_path, monkeypatch):
+        """Test that .env values are read and unrelated keys are ignored."""
+        monkeypatch.delenv("MCP_SERVER_PORT", raising=False)
+        env_file = tmp_path / ".env"
+        env_file.write_text("MCP_SERVER_PORT=4321\nUNRELATED_SETTING=1\n")
+        assert Settings(_env_file=env_file).mcp_server_port == 4321
+
+    def test_env_file_next_to_config_loaded_from_other_cwd(self, tmp_path, monkeypatch):
+        """Test that the .env beside config.py is found whatever the working directory."""
+        install_dir = tmp_path / "install"
+        install_dir.mkdir()
+        shutil.copy(config.__file__, install_dir / "config.py")
+        (install_dir / ".env").write_text("MCP_SERVER_NAME=FromDotEnv\n")
+        monkeypatch.delenv("MCP_SERVER_NAME", raising=False)
+        monkeypatch.setenv("PYTHONPATH", str(install_dir))
+
+        result = subprocess.run(
+            [sys.executable, "-c", "import config; print(config.settings.mcp_server_name)"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        assert result.stdout.strip() == "FromDotEnv", result.stderr
+
+    def test_numeric_settings_bounded(self):
+        """Test that out-of-range numeric settings are rejected at load time."""
+        with pytest.raises(ValueError):
+            Settings(mcp_server_port=70000)
+        with pytest.raises(ValueError):
+            Settings(request_timeout=0)
+        with pytest.raises(ValueError):
+            Settings(max_retries=-1)
+        with pytest.raises(ValueError):
+            Settings(retry_delay=-0.5)
+
+    def test_settings_frozen(self):
+        """Test that settings cannot be mutated after loading."""
+        with pytest.raises(ValueError):
+            settings.mcp_server_port = 1
+
+    def test_transport_normalized(self):
+        """Test that transport names are canonicalized at load time."""
+        assert Settings(mcp_transport="HTTP").mcp_transport == "streamable-http"
+        assert Settings(mcp_transport=" Stdio ").mcp_transport == "stdio"
+        with pytest.raises(ValueError):
+            Settings(mcp_transport="carrier-pigeon")
+
+    def test_transport_interned(self):
+        """Test that validated transport names are the interned constants."""
+        assert Settings(mcp_transport="STDIO").mcp_transport is TRANSPORT_STDIO
+        assert Settings(mcp_transport="http").mcp_transport is TRANSPORT_STREAMABLE_HTTP
+        assert Settings().mcp_transport is TRANSPORT_STREAMABLE_HTTP
+
+    def test_rate_limit_delay_precomputed(self):
+        """Test that the request delay follows API key availability."""
+        assert Settings(semantic_scholar_api_key="key")._rate_limit_delay == 1.0
+        assert Settings(semantic_scholar_api_key="")._rate_limit_delay == 3.0
+
+    def test_headers_cached(self):
+        """Test that request headers are built once and are read-only."""
+        headers = get_semantic_scholar_headers()
+        assert headers is get_semantic_scholar_headers()
+        assert headers["Accept"] == "application/json"
+        with pytest.raises(TypeError):
+            headers["Accept"] = "text/plain"
+
 
 class TestHTTPClient:
     """Test HTTP client functionality."""
@@ -62,68 +213,360 @@ class TestAPIRequests:
     """Test API request functionality."""
 
     @pytest.mark.asyncio
-    async def test_make_api_request_success(self):
+    async def test_make_api_request_success(self, mock_api):
         """Test successful API request."""
         mock_response = {
             "data": [{"paperId": "123", "title": "Test Paper"}],
             "total": 1,
         }
+        mock_api.respond(mock_response)
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value = mock_client
+        result = await make_api_request("/test/endpoint")
+        assert result == mock_response
+        assert len(mock_api.requests) == 1
 
-            mock_response_obj = AsyncMock()
-            mock_response_obj.json.return_value = mock_response
-            mock_response_obj.raise_for_status.return_value = None
-            mock_client.get.return_value = mock_response_obj
+    @pytest.mark.asyncio
+    async def test_make_api_request_rate_limit_error(self, mock_api):
+        """Test handling of rate limit errors."""
+        mock_api.respond(httpx.Response(429, text="Rate limit exceeded"))
 
-            result = await make_api_request("/test/endpoint")
-            assert result == mock_response
-            mock_client.get.assert_called_once()
+        with pytest.raises(httpx.HTTPError, match="Rate limit exceeded"):
+            await make_api_request("/test/endpoint")
 
     @pytest.mark.asyncio
-    async def test_make_api_request_rate_limit_error(self):
-        """Test handling of rate limit errors."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value = mock_client
+    async def test_make_api_request_not_found_error(self, mock_api):
+        """Test handling of 404 errors."""
+        mock_api.respond(httpx.Response(404, text="Not found"))
 
-            mock_response_obj = AsyncMock()
-            mock_response_obj.status_code = 429
-            mock_response_obj.text = "Rate limit exceeded"
+        with pytest.raises(httpx.HTTPError, match="Resource not found"):
+            await make_api_request("/test/endpoint")
 
-            mock_client.get.side_effect = httpx.HTTPStatusError(
-                "Too Many Requests", request=MagicMock(), response=mock_response_obj
-            )
 
-            with pytest.raises(httpx.HTTPError, match="Rate limit exceeded"):
-                await make_api_request("/test/endpoint")
+class TestResponseFiltering:
+    """Test post-processing of API responses."""
+
+    def test_strip_disclaimers_inplace(self):
+        """Test that openAccessPdf disclaimers are removed at any depth."""
+        pdf = {"url": "https://example.org/a.pdf", "disclaimer": "legal text"}
+        data = {
+            "data": [
+                {"paperId": "123", "openAccessPdf": pdf},
+                {"citingPaper": {"openAccessPdf": {"url": "b.pdf", "disclaimer": "x"}}},
+                {"paperId": "456", "openAccessPdf": None},
+            ]
+        }
+
+        _strip_disclaimers_inplace(data)
+
+        assert data["data"][0]["openAccessPdf"] is pdf
+        assert pdf == {"url": "https://example.org/a.pdf"}
+        assert data["data"][1]["citingPaper"]["openAccessPdf"] == {"url": "b.pdf"}
+        assert data["data"][2]["openAccessPdf"] is None
+
+    def test_requests_open_access_pdf(self):
+        """Test that filtering only runs when openAccessPdf can be returned."""
+        assert not _requests_open_access_pdf(None)
+        assert not _requests_open_access_pdf({"query": "test"})
+        assert not _requests_open_access_pdf({"fields": "title,year"})
+        assert _requests_open_access_pdf({"fields": "title,openAccessPdf"})
+        assert _requests_open_access_pdf({"fields": "citingPaper.openAccessPdf"})
 
     @pytest.mark.asyncio
-    async def test_make_api_request_not_found_error(self):
-        """Test handling of 404 errors."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value = mock_client
+    async def test_raw_request_strips_disclaimers(self, mock_api):
+        """Test that raw responses are passed through unless a disclaimer must go."""
+        payload = {"paperId": "123", "openAccessPdf": {"url": "a.pdf", "disclaimer": "x"}}
+        mock_api.respond(payload)
+
+        untouched = await make_api_request("/graph/v1/paper/123", {"fields": "title"}, raw=True)
+        stripped = await make_api_request(
+            "/graph/v1/paper/123", {"fields": "openAccessPdf"}, raw=True
+        )
+
+        assert untouched == httpx.Response(200, json=payload).content
+        assert orjson.loads(stripped) == {"paperId": "123", "openAccessPdf": {"url": "a.pdf"}}
 
-            mock_response_obj = AsyncMock()
-            mock_response_obj.status_code = 404
-            mock_response_obj.text = "Not found"
 
-            mock_client.get.side_effect = httpx.HTTPStatusError(
-                "Not Found", request=MagicMock(), response=mock_response_obj
+class TestResponseCache:
+    """Test in-process caching of API responses."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(self, mock_api):
+        """Test that identical requests hit the network only once."""
+        mock_api.respond({"paperId": "123"})
+
+        first = await make_api_request("/graph/v1/paper/123", {"a": 1, "b": 2})
+        second = await make_api_request("/graph/v1/paper/123", {"b": 2, "a": 1})
+
+        assert first == second == {"paperId": "123"}
+        assert len(mock_api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_send(self, mock_api):
+        """Test that identical in-flight requests are sent only once."""
+        mock_api.respond({"paperId": "123"})
+
+        with patch("server._cache_put"):
+            first, second = await asyncio.gather(
+                make_api_request("/graph/v1/paper/123"),
+                make_api_request("/graph/v1/paper/123"),
             )
 
-            with pytest.raises(httpx.HTTPError, match="Resource not found"):
-                await make_api_request("/test/endpoint")
+        assert first is second
+        assert len(mock_api.requests) == 1
+        assert not server._inflight_requests
+
+    @pytest.mark.asyncio
+    async def test_different_params_not_shared(self, mock_api):
+        """Test that requests with different parameters are cached separately."""
+        mock_api.respond({"data": []})
+
+        await make_api_request("/graph/v1/paper/search", {"query": "a"})
+        await make_api_request("/graph/v1/paper/search", {"query": "b"})
+
+        assert len(mock_api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_refetched(self, mock_api):
+        """Test that entries older than the TTL are fetched again."""
+        mock_api.respond({"paperId": "123"})
+
+        await make_api_request("/graph/v1/paper/123")
+        _expire_cache()
+        await make_api_request("/graph/v1/paper/123")
+
+        assert len(mock_api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_revalidated_with_etag(self, mock_api):
+        """Test that an expired ETag entry is revalidated instead of re-downloaded."""
+        mock_api.respond(
+            httpx.Response(200, json={"paperId": "123"}, headers={"ETag": '"v1"'}),
+            httpx.Response(304),
+        )
+
+        first = await make_api_request("/graph/v1/paper/123")
+        _expire_cache()
+        second = await make_api_request("/graph/v1/paper/123")
+
+        assert first == second == {"paperId": "123"}
+        assert mock_api.requests[-1].headers["If-None-Match"] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_revalidated_entry_evicted_during_request(self, mock_api):
+        """Test that a 304 is served from the captured entry even after eviction."""
+        def not_modified(request):
+            # The entry is evicted while the conditional request is in flight
+            clear_response_cache()
+            return httpx.Response(304)
+
+        mock_api.respond(
+            httpx.Response(200, json={"paperId": "123"}, headers={"ETag": '"v1"'}),
+            not_modified,
+        )
+
+        await make_api_request("/graph/v1/paper/123")
+        _expire_cache()
+        result = await make_api_request("/graph/v1/paper/123")
+
+        assert result == {"paperId": "123"}
+        assert len(server._response_cache) == 1
+
+    def test_full_cache_admits_repeat_keys_only(self):
+        """Test that one-off keys cannot evict entries from a full cache."""
+        with patch("server.settings", Settings(response_cache_max_size=2)):
+            server._cache_put(("GET", "/a", ""), {"a": 1})
+            server._cache_put(("GET", "/b", ""), {"b": 1})
+            server._cache_put(("GET", "/c", ""), {"c": 1})
+            assert list(server._response_cache) == [("GET", "/a", ""), ("GET", "/b", "")]
+
+            server._cache_put(("GET", "/c", ""), {"c": 1})
+            assert list(server._response_cache) == [("GET", "/b", ""), ("GET", "/c", "")]
+
+    def test_full_cache_of_expired_entries_admits_new_keys(self):
+        """Test that the doorkeeper never protects an expired LRU entry."""
+        with patch("server.settings", Settings(response_cache_max_size=2)):
+            server._cache_put(("GET", "/a", ""), {"a": 1})
+            server._cache_put(("GET", "/b", ""), {"b": 1})
+            _expire_cache()
+
+            server._cache_put(("GET", "/c", ""), {"c": 1})
+            assert list(server._response_cache) == [("GET", "/b", ""), ("GET", "/c", "")]
+
+
+class TestRateLimiting:
+    """Test client-side request throttling."""
+
+    @pytest.mark.asyncio
+    async def test_first_request_not_delayed(self):
+        """Test that no delay is added when the previous request is long past."""
+        sleep = AsyncMock()
+        with patch("server._next_send_ts", float("-inf")), \
+                patch("server._sleep", sleep):
+            await server._wait_for_rate_limit()
+
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_back_to_back_requests_spaced(self):
+        """Test that a request right after another waits for the rate limit delay."""
+        sleep = AsyncMock()
+        with patch("server._next_send_ts", float("-inf")), \
+                patch("server._sleep", sleep):
+            await server._wait_for_rate_limit()
+            await server._wait_for_rate_limit()
+
+        sleep.assert_awaited_once()
+        (wait,), _ = sleep.call_args
+        assert 0 < wait <= get_rate_limit_delay()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_get_distinct_slots(self):
+        """Test that a concurrent burst is spread out one delay apart."""
+        sleep = AsyncMock()
+        with patch("server._next_send_ts", float("-inf")), \
+                patch("server._sleep", sleep):
+            await asyncio.gather(*(server._wait_for_rate_limit() for _ in range(3)))
+
+        waits = sorted(call.args[0] for call in sleep.call_args_list)
+        delay = get_rate_limit_delay()
+        assert len(waits) == 2
+        assert waits[0] == pytest.approx(delay, abs=0.05)
+        assert waits[1] == pytest.approx(2 * delay, abs=0.05)
+
+
+class TestRetries:
+    """Test retrying of rate limited and failing API responses."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_request_retried(self, mock_api):
+        """Test that a 429 is retried after at least the Retry-After delay."""
+        mock_api.respond(
+            httpx.Response(429, headers={"Retry-After": "5"}),
+            {"paperId": "123"},
+        )
+
+        result = await make_api_request("/graph/v1/paper/123")
+
+        assert result == {"paperId": "123"}
+        assert len(mock_api.requests) == 2
+        assert max(call.args[0] for call in mock_api.sleep.call_args_list) >= 5
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("retry_after", ["3600", "inf", "nan"])
+    async def test_long_retry_after_not_waited(self, mock_api, monkeypatch, retry_after):
+        """Test that a Retry-After beyond request_timeout raises instead of sleeping."""
+        monkeypatch.setattr(server, "_rate_limit_delay", 0.0)
+        monkeypatch.setattr(server, "_next_send_ts", 0.0)
+        mock_api.respond(httpx.Response(429, headers={"Retry-After": retry_after}))
+
+        with pytest.raises(httpx.HTTPError, match="Rate limit"):
+            await make_api_request("/graph/v1/paper/123")
+
+        assert len(mock_api.requests) == 1
+        mock_api.sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_retries_exhausted(self, mock_api):
+        """Test that the error is raised once max_retries is used up."""
+        mock_api.respond(httpx.Response(503))
+
+        with pytest.raises(httpx.HTTPError, match="Server error"):
+            await make_api_request("/graph/v1/paper/123")
+
+        assert len(mock_api.requests) == settings.max_retries + 1
+
+
+class TestPaperBatching:
+    """Test coalescing of concurrent paper detail lookups against the API."""
+
+    @staticmethod
+    def _papers_api(request):
+        """Serve /paper/{id} and /paper/batch, rejecting IDs the API cannot parse."""
+        if request.method == "POST":
+            ids = orjson.loads(request.content)["ids"]
+            if "bad id" in ids:
+                return httpx.Response(400, json={"error": "Unacceptable ID"})
+            return [{"paperId": paper_id} for paper_id in ids]
+        paper_id = request.url.path.rsplit("/", 1)[-1]
+        if paper_id == "bad id":
+            return httpx.Response(400, json={"error": "Unacceptable ID"})
+        return {"paperId": paper_id}
+
+    @pytest.mark.asyncio
+    async def test_cached_papers_not_batched(self, mock_api):
+        """Test that concurrent lookups of cached papers send no request."""
+        mock_api.respond(self._papers_api)
+        await get_paper_details("A")
+        await get_paper_details("B")
+
+        results = await asyncio.gather(get_paper_details("A"), get_paper_details("B"))
+
+        assert [orjson.loads(r) for r in results] == [{"paperId": "A"}, {"paperId": "B"}]
+        assert len(mock_api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_results_cached_per_paper(self, mock_api):
+        """Test that papers from a batch serve later single lookups from the cache."""
+        mock_api.respond(self._papers_api)
+        await asyncio.gather(get_paper_details("A"), get_paper_details("B"))
+
+        result = await get_paper_details("B")
+
+        assert orjson.loads(result) == {"paperId": "B"}
+        assert [request.method for request in mock_api.requests] == ["POST"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [b'[{"paperId": "A"}]', b"null", b'{"data": []}'])
+    async def test_malformed_batch_response_fails_every_caller(self, mock_api, body):
+        """Test that a batch response that doesn't match the IDs fails instead of hanging."""
+        mock_api.respond(httpx.Response(200, content=body))
+
+        results = await asyncio.wait_for(
+            asyncio.gather(get_paper_details("A"), get_paper_details("B")), timeout=5
+        )
+
+        for result in results:
+            assert "Unexpected batch response" in orjson.loads(result)["error"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_fails_waiting_callers(self):
+        """Test that callers of a batch whose flush is cancelled get an error."""
+        lookups = [asyncio.ensure_future(server._fetch_paper(p, None)) for p in ("A", "B")]
+        await asyncio.sleep(0)
+        for task in list(server._paper_batch_tasks):
+            task.cancel()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*lookups, return_exceptions=True), timeout=5
+        )
+
+        assert all(isinstance(r, httpx.HTTPError) for r in results)
+        assert not server._pending_papers
+
+    @pytest.mark.asyncio
+    async def test_bad_id_fails_only_its_caller(self, mock_api):
+        """Test that a batch rejected with 400 is retried one paper at a time."""
+        mock_api.respond(self._papers_api)
+
+        good, bad = await asyncio.gather(get_paper_details("A"), get_paper_details("bad id"))
+
+        assert orjson.loads(good) == {"paperId": "A"}
+        assert "Bad Request (400)" in orjson.loads(bad)["error"]
+        assert [request.method for request in mock_api.requests] == ["POST", "GET", "GET"]
 
 
 class TestTools:
     """Test MCP tools functionality."""
 
+    @pytest.fixture(autouse=True)
+    def mock_request(self, monkeypatch):
+        """Replace make_api_request for every tool test; monkeypatch reverts it."""
+        mock = AsyncMock()
+        monkeypatch.setattr("server.make_api_request", mock)
+        return mock
+
     @pytest.mark.asyncio
-    async def test_search_papers_success(self):
+    async def test_search_papers_success(self, mock_request):
         """Test successful paper search."""
         mock_result = {
             "data": [
@@ -133,56 +576,104 @@ class TestTools:
             "total": 2,
         }
 
-        with patch("server.make_api_request", return_value=mock_result):
-            result = await search_papers("machine learning", limit=2)
+        mock_request.return_value = json.dumps(mock_result).encode()
+
+        result = await search_papers("machine learning", limit=2)
+
+        # Result should be JSON string
+        parsed_result = orjson.loads(result)
+        metadata = parsed_result.pop("_metadata")
+        assert parsed_result == mock_result
+        assert len(parsed_result["data"]) == 2
+        assert metadata["query"] == "machine learning"
+        assert metadata["parameters_used"]["limit"] == 2
 
-            # Result should be JSON string
-            parsed_result = json.loads(result)
-            assert parsed_result == mock_result
-            assert len(parsed_result["data"]) == 2
+    def test_append_metadata(self):
+        """Test that metadata is spliced into encoded objects, including empty ones."""
+        metadata = {"query": "q"}
+
+        assert orjson.loads(_append_metadata(b'{"total": 0}\n', metadata)) == {
+            "total": 0,
+            "_metadata": metadata,
+        }
+        assert orjson.loads(_append_metadata(b"{ }", metadata)) == {"_metadata": metadata}
+        with pytest.raises(ValueError):
+            _append_metadata(b"[]", metadata)
 
     @pytest.mark.asyncio
-    async def test_search_papers_with_filters(self):
+    async def test_search_papers_with_filters(self, mock_request):
         """Test paper search with filters."""
         mock_result = {"data": [], "total": 0}
 
-        with patch("server.make_api_request", return_value=mock_result) as mock_request:
-            await search_papers(
-                "deep learning",
-                limit=50,
-                offset=10,
-                fields="paperId,title,year",
-                publication_types="JournalArticle",
-                publication_date_or_year="2023",
-                min_citation_count=10,
-            )
+        mock_request.return_value = json.dumps(mock_result).encode()
+
+        await search_papers(
+            "deep learning",
+            limit=50,
+            offset=10,
+            fields="paperId,title,year",
+            publication_types="JournalArticle",
+            publication_date_or_year="2023",
+            min_citation_count=10,
+        )
+
+        # Verify the API was called with correct parameters
+        mock_request.assert_called_once()
+        call_args = mock_request.call_args
+        assert call_args[0][0] == "/graph/v1/paper/search"
+        params = call_args[0][1]
+        assert params["query"] == "deep learning"
+        assert params["limit"] == 50
+        assert params["offset"] == 10
+        assert params["fields"] == "paperId,title,year"
+        assert params["publicationTypes"] == "JournalArticle"
+        assert params["publicationDateOrYear"] == "2023"
+        assert params["minCitationCount"] == 10
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "date_filter,expected",
+        [
+            ("2023-2024", "2023:2024"),
+            ("2024-01:2024-06", "2024-01:2024-06"),
+            ("2024-01", "2024-01"),
+        ],
+    )
+    async def test_search_papers_year_range_normalized(self, mock_request, date_filter, expected):
+        """Test that only dash-separated year ranges are rewritten."""
+        mock_result = {"data": [], "total": 0}
 
-            # Verify the API was called with correct parameters
-            mock_request.assert_called_once()
-            call_args = mock_request.call_args
-            assert call_args[0][0] == "/graph/v1/paper/search"
-            params = call_args[0][1]
-            assert params["query"] == "deep learning"
-            assert params["limit"] == 50
-            assert params["offset"] == 10
-            assert params["fields"] == "paperId,title,year"
-            assert params["publicationTypes"] == "JournalArticle"
-            assert params["publicationDateOrYear"] == "2023"
-            assert params["minCitationCount"] == 10
-
-    @pytest.mark.asyncio
-    async def test_search_papers_error_handling(self):
+        mock_request.return_value = json.dumps(mock_result).encode()
+
+        await search_papers("deep learning", publication_date_or_year=date_filter)
+
+        params = mock_request.call_args[0][1]
+        assert params["publicationDateOrYear"] == expected
+
+    @pytest.mark.asyncio
+    async def test_search_papers_error_handling(self, mock_request):
         """Test paper search error handling."""
-        with patch("server.make_api_request", side_effect=Exception("API Error")):
-            result = await search_papers("test query")
+        mock_request.side_effect = Exception("API Error")
+
+        result = await search_papers("test query")
 
-            # Should return error in JSON format
-            parsed_result = json.loads(result)
-            assert "error" in parsed_result
-            assert "API Error" in parsed_result["error"]
+        # Should return error in JSON format
+        parsed_result = orjson.loads(result)
+        assert "error" in parsed_result
+        assert "API Error" in parsed_result["error"]
 
     @pytest.mark.asyncio
-    async def test_get_paper_details_success(self):
+    async def test_search_papers_invalid_fields(self, mock_request):
+        """Test that unknown field names are rejected before calling the API."""
+        result = await search_papers("test query", fields="title, bogus,year,nope")
+
+        parsed_result = orjson.loads(result)
+        assert parsed_result["parameter"] == "fields"
+        assert parsed_result["invalid_fields"] == ["bogus", "nope"]
+        mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_paper_details_success(self, mock_request):
         """Test successful paper details retrieval."""
         mock_result = {
             "paperId": "123",
@@ -191,15 +682,73 @@ class TestTools:
             "year": 2023,
         }
 
-        with patch("server.make_api_request", return_value=mock_result):
-            result = await get_paper_details("123")
+        mock_request.return_value = json.dumps(mock_result).encode()
+
+        result = await get_paper_details("123")
 
-            parsed_result = json.loads(result)
-            assert parsed_result == mock_result
-            assert parsed_result["paperId"] == "123"
+        parsed_result = orjson.loads(result)
+        assert parsed_result == mock_result
+        assert parsed_result["paperId"] == "123"
 
     @pytest.mark.asyncio
-    async def test_search_authors_success(self):
+    async def test_get_paper_details_error_handling(self, mock_request):
+        """Test that tool errors are returned as a JSON error envelope."""
+        mock_request.side_effect = httpx.HTTPError("boom")
+
+        result = await get_paper_details("123")
+
+        parsed_result = orjson.loads(result)
+        assert parsed_result == {"error": "Error fetching paper details: boom"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_paper_details_coalesced(self, mock_request):
+        """Test that concurrent detail lookups share one batch request."""
+        mock_result = [{"paperId": "123", "title": "Test Paper"}, None]
+
+        mock_request.return_value = mock_result
+
+        found, missing = await asyncio.gather(
+            get_paper_details("123", fields="title"),
+            get_paper_details("missing", fields="title"),
+        )
+
+        mock_request.assert_called_once_with(
+            "/graph/v1/paper/batch",
+            {"fields": "title"},
+            method="POST",
+            json_body={"ids": ["123", "missing"]},
+        )
+        assert orjson.loads(found) == mock_result[0]
+        assert "Resource not found" in orjson.loads(missing)["error"]
+
+    @pytest.mark.asyncio
+    async def test_get_papers_batch_success(self, mock_request):
+        """Test that batch lookups send the IDs in one POST body."""
+        mock_result = [{"paperId": "123", "title": "Test Paper"}, None]
+
+        mock_request.return_value = json.dumps(mock_result).encode()
+
+        result = await get_papers_batch(["123", "missing"], fields="title")
+
+        assert orjson.loads(result) == mock_result
+        mock_request.assert_called_once_with(
+            "/graph/v1/paper/batch",
+            {"fields": "title"},
+            method="POST",
+            json_body={"ids": ["123", "missing"]},
+            raw=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_papers_batch_empty_ids(self, mock_request):
+        """Test that an empty batch is rejected without calling the API."""
+        result = await get_papers_batch([])
+
+        assert "error" in orjson.loads(result)
+        mock_request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_authors_success(self, mock_request):
         """Test successful author search."""
         mock_result = {
             "data": [
@@ -209,15 +758,16 @@ class TestTools:
             "total": 2,
         }
 
-        with patch("server.make_api_request", return_value=mock_result):
-            result = await search_authors("John Smith")
+        mock_request.return_value = json.dumps(mock_result).encode()
+
+        result = await search_authors("John Smith")
 
-            parsed_result = json.loads(result)
-            assert parsed_result == mock_result
-            assert len(parsed_result["data"]) == 2
+        parsed_result = orjson.loads(result)
+        assert parsed_result == mock_result
+        assert len(parsed_result["data"]) == 2
 
     @pytest.mark.asyncio
-    async def test_get_author_details_success(self):
+    async def test_get_author_details_success(self, mock_request):
         """Test successful author details retrieval."""
         mock_result = {
             "authorId": "123",
@@ -226,12 +776,34 @@ class TestTools:
             "citationCount": 1000,
         }
 
-        with patch("server.make_api_request", return_value=mock_result):
-            result = await get_author_details("123")
+        mock_request.return_value = json.dumps(mock_result).encode()
 
-            parsed_result = json.loads(result)
-            assert parsed_result == mock_result
-            assert parsed_result["authorId"] == "123"
+        result = await get_author_details("123")
+
+        parsed_result = orjson.loads(result)
+        assert parsed_result == mock_result
+        assert parsed_result["authorId"] == "123"
+
+    @pytest.mark.asyncio
+    async def test_get_author_full_profile_success(self, mock_request):
+        """Test that author details and papers are fetched together."""
+        responses = {
+            "/graph/v1/author/123": {"authorId": "123", "name": "Test Author"},
+            "/graph/v1/author/123/papers": {"data": [{"paperId": "p1"}]},
+        }
+
+        async def fake_request(endpoint, params, raw=False):
+            return json.dumps(responses[endpoint]).encode()
+
+        mock_request.side_effect = fake_request
+
+        result = await get_author_full_profile("123", paper_fields="title", limit=5)
+
+        assert orjson.loads(result) == {
+            "details": responses["/graph/v1/author/123"],
+            "papers": responses["/graph/v1/author/123/papers"],
+        }
+        assert mock_request.call_args_list[1].args[1] == {"limit": 5, "fields": "title"}
 
 
 class TestResources:
@@ -244,7 +816,7 @@ class TestResources:
         from server import get_api_info
 
         result = await get_api_info()
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
 
         assert "api_base_url" in parsed_result
         assert "has_api_key" in parsed_result
@@ -258,7 +830,7 @@ class TestResources:
         from server import get_available_fields
 
         result = await get_available_fields()
-        parsed_result = json.loads(result)
+        parsed_result = orjson.loads(result)
 
         assert "paper_fields" in parsed_result
         assert "author_fields" in parsed_result
@@ -267,6 +839,14 @@ class TestResources:
         assert "paperId" in parsed_result["paper_fields"]
         assert "title" in parsed_result["paper_fields"]
 
+    @pytest.mark.asyncio
+    async def test_resource_payloads_reused(self):
+        """Test that static resource payloads are serialized only once."""
+        from server import get_ai_agent_guidelines, get_api_info
+
+        assert await get_api_info() is await get_api_info()
+        assert await get_ai_agent_guidelines() is await get_ai_agent_guidelines()
+
 
 class TestPrompts:
     """Test MCP prompts functionality."""
@@ -290,8 +870,9 @@ class TestPrompts:
 
         assert isinstance(messages, list)
         assert len(messages) >= 3
-        assert any("123" in str(msg) for msg in messages)
-        assert any("summary" in str(msg) for msg in messages)
+        blob = "\n".join(map(str, messages))
+        assert "123" in blob
+        assert "summary" in blob
 
     def test_author_research_prompt(self):
         """Test author research prompt generation."""
@@ -312,38 +893,47 @@ class TestIntegration:
     async def test_server_startup_and_shutdown(self):
         """Test server lifecycle management."""
         # Test that we can initialize and close the HTTP client
-        await init_http_client()
-        await close_http_client()
+        with patch("server.http_client", None):
+            client = await init_http_client()
+            request = client.build_request("GET", "/graph/v1/paper/123")
+            assert str(request.url) == f"{settings.semantic_scholar_base_url}/graph/v1/paper/123"
+            await close_http_client()
 
     @pytest.mark.asyncio
     async def test_end_to_end_paper_search(self):
         """Test end-to-end paper search with mocked API."""
         mock_result = {
-            "data": [{"paperId": "test123", "title": "Test Paper"}],
-            "total": 1,
+            "data": [
+                {"paperId": "test123", "title": "Test Paper"},
+                {"paperId": "test456", "title": "Another Paper"},
+            ],
+            "total": 2,
         }
+        mock_details = {
+            paper["paperId"]: dict(paper, abstract=f"Abstract of {paper['title']}")
+            for paper in mock_result["data"]
+        }
+
+        async def fake_request(endpoint, params, method="GET", json_body=None, raw=False):
+            if endpoint == "/graph/v1/paper/search":
+                return json.dumps(mock_result).encode()
+            # Concurrent detail lookups arrive as one batch request
+            return [mock_details[paper_id] for paper_id in json_body["ids"]]
 
-        with patch("server.make_api_request", return_value=mock_result):
+        with patch("server.make_api_request", side_effect=fake_request) as mock_request:
             # Test search
             search_result = await search_papers("test query")
-            search_data = json.loads(search_result)
+            search_data = orjson.loads(search_result)
 
-            assert search_data["total"] == 1
-            paper_id = search_data["data"][0]["paperId"]
+            assert search_data["total"] == 2
 
-            # Test getting details for the found paper
-            mock_detail = {
-                "paperId": paper_id,
-                "title": "Test Paper",
-                "abstract": "Test abstract",
-            }
-
-            with patch("server.make_api_request", return_value=mock_detail):
-                detail_result = await get_paper_details(paper_id)
-                detail_data = json.loads(detail_result)
+            # Test getting details for all found papers at once
+            details = await asyncio.gather(
+                *(get_paper_details(p["paperId"]) for p in search_data["data"])
+            )
 
-                assert detail_data["paperId"] == paper_id
-                assert detail_data["title"] == "Test Paper"
+            assert [orjson.loads(detail) for detail in details] == list(mock_details.values())
+            assert mock_request.call_count == 2
 
 
 if __name__ == "__main__":
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""MCP protocol tests against the shared stdio server from conftest.py"""
+import orjson
+import pytest
+
+
+def test_mcp_initialize(mcp_server):
+    """Test MCP initialize protocol (sent once by the fixture)"""
+    response = mcp_server.initialize_result
+    assert "protocolVersion" in response.get("result", {}), response
+
+
+@pytest.mark.parametrize(
+    "method,params,expect",
+    [
+        ("tools/list", {}, "search_papers"),
+        ("resources/list", {}, "semantic-scholar://api-info"),
+        pytest.param(
+            "tools/call",
+            {"name": "search_papers", "arguments": {"query": "deep learning", "limit": 2}},
+            "total",
+            marks=pytest.mark.integration,
+            id="tools/call-search_papers",
+        ),
+    ],
+)
+def test_mcp_request(mcp_server, method, params, expect):
+    """Test that each request gets a result mentioning what it should"""
+    response = mcp_server.send(method, params)
+
+    assert "result" in response, response
+    result = orjson.dumps(response["result"]).decode()
+    assert expect in result, f"{expect!r} not in {method} result: {result[:2000]}"